@@ -5,18 +5,24 @@ Navigation reflects: Home · Learn · Profile, as shown in the design.  :content
 
 import streamlit as st
 from state import ensure_state
-from utils import welcome_copy
+from utils import PAGE_CFG, welcome_copy
 
-st.set_page_config(page_title="Diabetes Risk Predictor", page_icon="🩺", layout="centered")
+_THREE_EVEN = (1, 1, 1)  # st.columns ratio for the centred CTA
+
+@st.cache_data(show_spinner=False)
+def _welcome() -> str:
+    return welcome_copy()
+
+st.set_page_config(**PAGE_CFG)
 ensure_state()
 
 # --- Header / Hero ---
 st.title("Diabetes Risk Predictor")
 st.subheader("Welcome to Your Health Journey")
-st.write(welcome_copy(''))
+st.write(_welcome())
 
 # --- Primary CTA ---
-col1, col2, col3 = st.columns([1, 1, 1])
+col1, col2, col3 = st.columns(_THREE_EVEN)
 with col2:
     if st.button("Start Assessment", type="primary"):
         st.switch_page("pages/risk.py")
@@ -1,206 +0,0 @@
-# app.py
-import streamlit as st
-
-# Configure page
-st.set_page_config(
-    page_title="Diabetes Prediction System",
-    subheader="Welcome to Your Health Journey"
-    page_icon="🩺",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Initialize session state for navigation
-if 'current_page' not in st.session_state:
-    st.session_state.current_page = 'Home'
-
-# Navigation function
-def show_navigation():
-    """Display navigation sidebar"""
-    st.sidebar.title("🩺 Diabetes Prediction")
-    st.sidebar.markdown("---")
-    
-    pages = {
-        "🏠 Home": "Home",
-        "📝 Patient Input": "Input",
-        "🔍 Risk Assessment": "Risk Assessment", 
-        "📊 Analytics": "Analytics",
-        "📋 History": "History",
-        "ℹ️ About": "About"
-    }
-    
-    # Create navigation buttons
-    for display_name, page_name in pages.items():
-        if st.sidebar.button(display_name, use_container_width=True):
-            st.session_state.current_page = page_name
-            st.rerun()
-
-# Page functions (skeleton versions)
-def show_home():
-    """Home page skeleton"""
-    st.title("🩺 Diabetes Risk Prediction System")
-    st.markdown("### Welcome to the AI-Powered Diabetes Risk Assessment Tool")
-    
-    # Placeholder content
-    st.info("🏠 **HOME PAGE** - This tool helps you understand your risk of developing type 2 diabetes. It's not a diagnosis, but it can guide you towards healthier choices.")
-    
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown("**Feature 1**\n- Placeholder content\n- Add your features")
-    with col2:
-        st.markdown("**Feature 2**\n- Placeholder content\n- Add your features")
-    with col3:
-        st.markdown("**Feature 3**\n- Placeholder content\n- Add your features")
-
-def show_input():
-    """Input page skeleton"""
-    st.title("📝 Patient Information")
-    st.info("📝 **INPUT PAGE** - Add your form components here")
-    
-    # Basic form skeleton
-    with st.form("patient_form"):
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Section 1")
-            st.text_input("Field 1", placeholder="Add your input fields")
-            st.number_input("Field 2", value=0)
-        
-        with col2:
-            st.subheader("Section 2")
-            st.text_input("Field 3", placeholder="Add your input fields")
-            st.selectbox("Field 4", ["Option 1", "Option 2"])
-        
-        submitted = st.form_submit_button("Submit", use_container_width=True)
-        
-        if submitted:
-            st.success("Form submitted! Add your processing logic here.")
-
-def show_prediction():
-    """Prediction page skeleton"""
-    st.title("🔍 Prediction Results")
-    st.info("🔍 **PREDICTION PAGE** - Add your results display here")
-    
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        st.markdown("### Main Results Area")
-        st.markdown("Add your charts, gauges, or result displays here")
-        
-        # Placeholder chart area
-        st.markdown("""
-        <div style="height: 300px; border: 2px dashed #ccc; display: flex; 
-                    align-items: center; justify-content: center; border-radius: 10px;">
-            <p style="color: #999; font-size: 18px;">Chart/Visualization Area</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("### Summary Panel")
-        st.markdown("Add result summary, recommendations, etc.")
-        
-        # Placeholder metrics
-        st.metric("Metric 1", "Value")
-        st.metric("Metric 2", "Value")
-
-def show_analytics():
-    """Analytics page skeleton"""
-    st.title("📊 Analytics Dashboard")
-    st.info("📊 **ANALYTICS PAGE** - Add your analytics and insights here")
-    
-    # Metrics row
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Total Users", "0", "0")
-    with col2:
-        st.metric("Predictions", "0", "0")
-    with col3:
-        st.metric("Accuracy", "0%", "0%")
-    with col4:
-        st.metric("Risk Cases", "0", "0")
-    
-    # Charts area
-    st.markdown("### Analytics Charts")
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        <div style="height: 250px; border: 2px dashed #ccc; display: flex; 
-                    align-items: center; justify-content: center; border-radius: 10px; margin: 10px 0;">
-            <p style="color: #999;">Chart 1 Area</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style="height: 250px; border: 2px dashed #ccc; display: flex; 
-                    align-items: center; justify-content: center; border-radius: 10px; margin: 10px 0;">
-            <p style="color: #999;">Chart 2 Area</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-def show_history():
-    """History page skeleton"""
-    st.title("📋 Prediction History")
-    st.info("📋 **HISTORY PAGE** - Add your history tracking here")
-    
-    # Placeholder table
-    st.markdown("### Previous Predictions")
-    st.markdown("Add your data table/history display here")
-    
-    # Sample empty state
-    st.markdown("""
-    <div style="text-align: center; padding: 3rem; color: #999;">
-        <h4>No predictions yet</h4>
-        <p>Make your first prediction to see history here</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-def show_about():
-    """About page skeleton"""
-    st.title("ℹ️ About")
-    st.info("ℹ️ **ABOUT PAGE** - Add your app information here")
-    
-    st.markdown("""
-    ### About This Application
-    
-    Add your app description, features, and information here.
-    
-    #### Key Features
-    - Feature 1
-    - Feature 2
-    - Feature 3
-    
-    #### Technology Stack
-    - Streamlit
-    - Python
-    - Machine Learning
-    
-    #### Disclaimer
-    Add your medical disclaimers and legal information here.
-    """)
-
-# Main application logic
-def main():
-    """Main app function with page routing"""
-    
-    # Show navigation
-    show_navigation()
-    
-    # Page routing based on session state
-    if st.session_state.current_page == 'Home':
-        show_home()
-    elif st.session_state.current_page == 'Input':
-        show_input()
-    elif st.session_state.current_page == 'Prediction':
-        show_prediction()
-    elif st.session_state.current_page == 'Analytics':
-        show_analytics()
-    elif st.session_state.current_page == 'History':
-        show_history()
-    elif st.session_state.current_page == 'About':
-        show_about()
-
-# Run the app
-if __name__ == "__main__":
-    main()
\ No newline at end of file
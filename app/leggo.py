@@ -3,8 +3,11 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
-from datetime import datetime, timedelta
 import json
+import csv
+import io
+from operator import itemgetter
+
 
 # Configure page settings
 st.set_page_config(
@@ -14,8 +17,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for styling
-st.markdown("""
+# Custom CSS for styling (a literal, emitted once per rerun from run())
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -73,7 +76,264 @@ st.markdown("""
         border-left: 4px solid #007bff;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Risk bins as lookup tables: a score in bin i (<= 30, <= 60, above) maps to
+# _RISK_LEVELS[i] and min(base + (score - base) * slope, cap) percent
+_RISK_BINS = np.array([30, 60])
+_RISK_LEVELS = np.array(["Low Risk", "Medium Risk", "High Risk"])
+_RISK_BASE = np.array([0, 30, 60])
+_RISK_SLOPE = np.array([2.0, 1.5, 1.2])
+_RISK_CAP = np.array([25, 60, 90])
+_RISK_INDEX = {level: i for i, level in enumerate(_RISK_LEVELS.tolist())}
+
+# Per-bin display, indexed Low / Medium / High like the tables above
+_RISK_ALERTS = (st.success, st.warning, st.error)
+_RISK_EXPLANATIONS = (
+    "**Great news!** You have a low risk of developing type 2 diabetes in the next 10 years. "
+    "Continue to maintain a healthy lifestyle to keep your risk low.",
+    "**Attention needed.** Based on your responses, your risk is considered medium. "
+    "This means you have a higher likelihood of developing type 2 diabetes compared to the general population, "
+    "but there are steps you can take to reduce your risk.",
+    "**Important consultation needed.** Your risk of developing type 2 diabetes is high. "
+    "This means you have several risk factors that significantly increase your likelihood of developing the condition. "
+    "It's important to consult a healthcare professional for further evaluation and personalized advice.",
+)
+_RISK_BANNER_HTML = tuple(
+    f'<div class="risk-{css}"><h2>{{risk_level}}</h2><p>Risk Percentage: {{risk_percentage}}%</p></div>'
+    for css in ("low", "medium", "high")
+)
+_SAMPLE_TREND_HTML = '<div class="risk-medium"><h3>Risk Level Over Time</h3><p>Medium</p><p>Last 12 Months: -10%</p></div>'
+
+def _bmi(weight, height):
+    """BMI from kg and cm; works on scalars and NumPy arrays alike."""
+    return weight * (10000.0 / (height * height))
+
+# Fallbacks for risk factors missing from user_data
+_RISK_DEFAULTS = {
+    'age': 0,
+    'bmi': 0,
+    'family_history': False,
+    'regular_exercise': True,
+    'high_bp': False,
+    'high_glucose': False,
+}
+_RISK_FIELDS = itemgetter(*_RISK_DEFAULTS)
+
+# Scorer selection by input size (score_dispatch). A rerun is dominated by
+# Streamlit and Plotly serialisation, not the handful of adds in the scorer,
+# so the common one-assessment case stays on the plain Python path: below
+# _BATCH_MIN_ROWS building a DataFrame costs more than it saves, and below
+# _KERNEL_MIN_ROWS the parallel kernel's thread launch outweighs the work
+_BATCH_MIN_ROWS = 4
+_KERNEL_MIN_ROWS = 32
+
+def _scoring():
+    """scoring.py if numba is installed, else None; imported on first use so
+    cold starts and small batches never load numba or compile the kernel."""
+    import scoring
+    return scoring if scoring.NUMBA_AVAILABLE else None
+
+# Assessment history is stored column-wise (struct of arrays): one typed
+# NumPy buffer per field plus a '_len' counter, grown by doubling when full
+_HISTORY_DTYPES = {
+    'date': 'datetime64[D]',
+    'risk_level': 'U11',
+    'risk_percentage': np.int16,
+    'bmi': np.float32,
+}
+_HISTORY_CAPACITY = 16
+
+def _new_history(capacity=_HISTORY_CAPACITY):
+    """Return an empty preallocated assessment history store."""
+    history = {key: np.empty(capacity, dtype) for key, dtype in _HISTORY_DTYPES.items()}
+    history['_len'] = 0
+    return history
+
+def _append_history(history, record):
+    """Write one assessment record into the next free slot of the store."""
+    n = history['_len']
+    if n == len(history['date']):
+        for key in _HISTORY_DTYPES:
+            grown = np.empty(2 * n, history[key].dtype)
+            grown[:n] = history[key]
+            history[key] = grown
+    for key in _HISTORY_DTYPES:
+        history[key][n] = record[key]
+    history['_len'] = n + 1
+
+# Recommendation cards as complete HTML blocks (blank lines let the markdown
+# inside the <div> render)
+_REC_CARD_HTML = '<div class="recommendation-card">\n\n{}\n\n</div>'
+_REC_EXERCISE_LOW = _REC_CARD_HTML.format("""#### 🏃‍♂️ Regular Physical Activity
+- Aim for at least 150 minutes of moderate-intensity aerobic activity per week, such as brisk walking
+- Include muscle-strengthening activities on 2 or more days per week
+- Start slowly and gradually increase duration and intensity""")
+_REC_EXERCISE_OK = _REC_CARD_HTML.format("""#### 🏃‍♂️ Regular Physical Activity
+- Excellent! Continue your current exercise routine
+- Consider adding variety with different types of activities
+- Monitor your progress and set new fitness goals""")
+_REC_SLEEP = _REC_CARD_HTML.format("""#### 🥗 Adequate Sleep
+- Aim for 7-9 hours of quality sleep each night to support overall health and well-being
+- Maintain a consistent sleep schedule
+- Create a relaxing bedtime routine""")
+_REC_STRESS_HIGH = _REC_CARD_HTML.format("""#### 🧘‍♀️ Stress Management
+- Practice stress-reduction techniques like meditation, yoga, or deep breathing
+- Consider counseling or therapy for persistent stress
+- Engage in hobbies and activities you enjoy""")
+_REC_STRESS_OK = _REC_CARD_HTML.format("""#### 🧘‍♀️ Stress Management
+- Continue managing stress with healthy coping strategies
+- Stay connected with friends and family
+- Maintain work-life balance""")
+_REC_WEIGHT = _REC_CARD_HTML.format("""#### ⚖️ Weight Management
+- Focus on maintaining a healthy weight through a balanced diet and regular physical activity
+- Consider consulting with a healthcare provider or registered dietitian
+- Aim for gradual, sustainable weight loss if needed""")
+_REC_MEDICAL = _REC_CARD_HTML.format("""#### 🩺 Medical Follow-up
+- **Important:** Consult with your healthcare provider for further evaluation
+- Regular check-ups and monitoring are recommended
+- Discuss preventive measures and early intervention strategies""")
+
+# Plotly figures are memoised on their inputs, so reruns with unchanged
+# data reuse the built figure instead of reconstructing it
+@st.cache_data(show_spinner=False)
+def _gauge_fig(risk_percentage):
+    """Risk gauge for the results page."""
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = risk_percentage,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Risk Level"},
+        gauge = {
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 30], 'color': "lightgreen"},
+                {'range': [30, 60], 'color': "yellow"},
+                {'range': [60, 100], 'color': "red"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+    fig.update_layout(height=300)
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _trend_fig(dates, risk_percentages):
+    """Risk-over-time line for the dashboard; keyed on the history columns."""
+    fig = px.line(x=dates, y=risk_percentages,
+                 title='Risk Level Over Time',
+                 labels={'y': 'Risk Percentage (%)', 'x': 'Date'})
+    fig.update_traces(line_color='#2E8B57', line_width=3)
+    fig.update_layout(height=400)
+    return fig
+
+# Demo series shown until there are two real assessments: five month-end
+# points, the sixth slot is replaced by the current assessment
+_SAMPLE_TREND_DATES = np.arange('2024-02', '2024-08', dtype='datetime64[M]').astype('datetime64[D]') - 1
+_SAMPLE_TREND_VALUES = np.array([25, 30, 28, 32, 29, 30], np.int16)
+_SAMPLE_TREND_CURRENT = np.arange(6) == 5
+_SAMPLE_TREND_COLORS = np.where(_SAMPLE_TREND_CURRENT, 'red', 'lightgray')
+_SAMPLE_TREND_SIZES = np.where(_SAMPLE_TREND_CURRENT, 10, 6)
+
+@st.cache_data(show_spinner=False)
+def _sample_trend_fig(current_percentage=None):
+    """Demo trend as a single trace; a current percentage adds the red final point."""
+    n = 5 if current_percentage is None else 6
+    values = _SAMPLE_TREND_VALUES[:n].copy()
+    if current_percentage is not None:
+        values[-1] = current_percentage
+    fig = go.Figure(go.Scatter(x=_SAMPLE_TREND_DATES[:n], y=values,
+                               mode='lines+markers',
+                               line=dict(color='lightgray', dash='dash'),
+                               marker=dict(color=_SAMPLE_TREND_COLORS[:n], size=_SAMPLE_TREND_SIZES[:n])))
+    fig.update_layout(title='Risk Level Over Time', 
+                    xaxis_title='Date', 
+                    yaxis_title='Risk Percentage (%)',
+                    height=400)
+    return fig
+
+# Health tracking logs use the same layout: one structured NumPy buffer per
+# log, timestamped entries, fill counts kept under health_data['_len']
+_LOG_DTYPES = {
+    'glucose_readings': np.dtype([('t', 'datetime64[s]'), ('mg_dl', 'f4')]),
+    'weight_log': np.dtype([('t', 'datetime64[s]'), ('kg', 'f4')]),
+    'exercise_log': np.dtype([('t', 'datetime64[s]'), ('minutes', 'f4')]),
+    'medication_log': np.dtype([('t', 'datetime64[s]'), ('medication', 'U32'), ('dose_mg', 'f4')]),
+}
+_LOG_CAPACITY = 256
+
+def _new_health_data(capacity=_LOG_CAPACITY):
+    """Return empty preallocated health logs."""
+    health_data = {name: np.zeros(capacity, dtype) for name, dtype in _LOG_DTYPES.items()}
+    health_data['_len'] = dict.fromkeys(_LOG_DTYPES, 0)
+    return health_data
+
+def append_log(name, **fields):
+    """
+    Append one entry to a health log in session state.
+    
+    Args:
+        name (str): One of the _LOG_DTYPES keys, e.g. 'weight_log'
+        **fields: Values for the log's fields; 't' defaults to now
+    """
+    health_data = st.session_state.health_data
+    log, n = health_data[name], health_data['_len'][name]
+    if n == len(log):
+        grown = np.zeros(2 * n, log.dtype)
+        grown[:n] = log
+        log = health_data[name] = grown
+    fields.setdefault('t', np.datetime64('now', 's'))
+    for key, value in fields.items():
+        log[key][n] = value
+    health_data['_len'][name] = n + 1
+
+def health_log(name):
+    """Return the filled part of a health log, e.g. health_log('weight_log')['kg']."""
+    health_data = st.session_state.health_data
+    return health_data[name][:health_data['_len'][name]]
+
+# Sidebar navigation menu: (label, page key), built once at import
+MENU_ITEMS = (
+    ("🏠 Home", "welcome"),
+    ("📝 Assessment", "assessment"),
+    ("📊 Results", "results"),
+    ("💡 Recommendations", "recommendations"),
+    ("📈 Dashboard", "dashboard"),
+    ("👤 Profile", "profile"),
+)
+
+def _nav_button(label, page, key=None, **kw):
+    """Button that switches current_page to page and reruns the whole app."""
+    if st.button(label, key=key or f"nav_{page}", **kw):
+        st.session_state.current_page = page
+        st.rerun(scope="app")
+
+def _nav_row(spec):
+    """Lay out a tuple of (label, page, button kwargs) in equal columns."""
+    for col, (label, page, opts) in zip(st.columns(len(spec)), spec):
+        with col:
+            _nav_button(label, page, use_container_width=True, **opts)
+
+# In-page navigation rows as (label, page, extra st.button kwargs)
+_RESULTS_NAV = (
+    ("📋 View Recommendations", "recommendations", {}),
+    ("📊 Health Dashboard", "dashboard", {}),
+    ("🔄 New Assessment", "assessment", {}),
+)
+_RECOMMENDATIONS_NAV = (
+    ("← Back to Results", "results", {}),
+    ("Health Dashboard →", "dashboard", {}),
+)
+_DASHBOARD_NAV = (
+    ("🔄 New Assessment", "assessment", {}),
+    ("📋 View Recommendations", "recommendations", {}),
+    ("👤 Profile Settings", "profile", {}),
+)
 
 class DiabetesRiskPredictor:
     """
@@ -89,36 +349,26 @@ class DiabetesRiskPredictor:
     
     def initialize_session_state(self):
         """Initialize all session state variables for the application."""
+        ss = st.session_state
+        
         # User data storage
-        if 'user_data' not in st.session_state:
-            st.session_state.user_data = {}
+        ss.setdefault('user_data', {})
         
         # Assessment data
-        if 'assessment_completed' not in st.session_state:
-            st.session_state.assessment_completed = False
-        
-        if 'risk_score' not in st.session_state:
-            st.session_state.risk_score = 0
-        
-        if 'risk_level' not in st.session_state:
-            st.session_state.risk_level = "Unknown"
-        
-        # Navigation state
-        if 'current_page' not in st.session_state:
-            st.session_state.current_page = "welcome"
-        
-        # Assessment history
-        if 'assessment_history' not in st.session_state:
-            st.session_state.assessment_history = []
-        
-        # Health tracking data
-        if 'health_data' not in st.session_state:
-            st.session_state.health_data = {
-                'glucose_readings': [],
-                'weight_log': [],
-                'exercise_log': [],
-                'medication_log': []
-            }
+        ss.setdefault('assessment_completed', False)
+        ss.setdefault('risk_score', 0)
+        ss.setdefault('risk_level', "Unknown")
+        
+        # Navigation state (seeded from ?page=... so routes can be deep-linked)
+        ss.setdefault('current_page', st.query_params.get("page", "welcome"))
+        
+        # Assessment history (explicit check so buffers are only allocated once)
+        if 'assessment_history' not in ss:
+            ss.assessment_history = _new_history()
+        
+        # Health tracking data (typed log buffers, allocated once per session)
+        if 'health_data' not in ss:
+            ss.health_data = _new_health_data()
     
     def calculate_risk_score(self, user_data):
         """
@@ -130,52 +380,102 @@ class DiabetesRiskPredictor:
         Returns:
             tuple: (risk_score, risk_level, risk_percentage)
         """
-        score = 0
-        
-        # Age scoring
-        age = user_data.get('age', 0)
-        if age >= 45:
-            score += 20
-        elif age >= 35:
-            score += 10
-        
-        # BMI scoring
-        bmi = user_data.get('bmi', 0)
-        if bmi >= 30:
-            score += 30
-        elif bmi >= 25:
-            score += 20
-        elif bmi >= 23:
-            score += 10
-        
-        # Family history
-        if user_data.get('family_history', False):
-            score += 25
-        
-        # Physical activity
-        if not user_data.get('regular_exercise', True):
-            score += 15
-        
-        # High blood pressure
-        if user_data.get('high_bp', False):
-            score += 15
-        
-        # Previous high glucose
-        if user_data.get('high_glucose', False):
-            score += 20
-        
-        # Determine risk level and percentage
-        if score <= 30:
-            risk_level = "Low Risk"
-            risk_percentage = min(score * 2, 25)
-        elif score <= 60:
-            risk_level = "Medium Risk"
-            risk_percentage = min(30 + (score - 30) * 1.5, 60)
+        # One defaults merge and one multi-key fetch instead of a .get() per field
+        age, bmi, family_history, regular_exercise, high_bp, high_glucose = _RISK_FIELDS(
+            {**_RISK_DEFAULTS, **user_data})
+        if 'bmi' not in user_data and 'weight' in user_data and 'height' in user_data:
+            bmi = _bmi(user_data['weight'], user_data['height'])
+        
+        score = (
+            (20 if age >= 45 else 10 if age >= 35 else 0)                   # Age
+            + (30 if bmi >= 30 else 20 if bmi >= 25 else 10 if bmi >= 23 else 0)  # BMI
+            + 25 * bool(family_history)                                     # Family history
+            + 15 * (not regular_exercise)                                   # Physical activity
+            + 15 * bool(high_bp)                                            # High blood pressure
+            + 20 * bool(high_glucose)                                       # Previous high glucose
+        )
+        
+        # Same bin tables as calculate_risk_score_batch
+        i = int(np.searchsorted(_RISK_BINS, score))
+        base = _RISK_BASE[i]
+        risk_percentage = min(base + (score - base) * _RISK_SLOPE[i], _RISK_CAP[i])
+        
+        return score, str(_RISK_LEVELS[i]), int(risk_percentage)
+    
+    def calculate_risk_score_batch(self, users):
+        """
+        Calculate diabetes risk scores for many users at once.
+        
+        Uses the compiled kernel from scoring.py when numba is installed and
+        there are at least _KERNEL_MIN_ROWS users, otherwise NumPy masks over
+        whole columns instead of per-user branches, so re-scoring a long
+        history costs a handful of array operations. Every path (this one,
+        the kernel and calculate_risk_score) must return identical results
+        for the same record, since score_dispatch picks between them by size.
+        
+        Args:
+            users (pd.DataFrame): One row per user, same fields as user_data;
+                missing columns and NaN cells take the calculate_risk_score defaults
+            
+        Returns:
+            tuple: (risk_scores, risk_levels, risk_percentages) as NumPy arrays
+        """
+        n = len(users)
+        col = {}
+        for key, default in _RISK_DEFAULTS.items():
+            if key in users:
+                # Fields a record lacks arrive as NaN; score them like calculate_risk_score does
+                values = users[key].to_numpy()
+                col[key] = np.where(pd.isna(values), default, values)
+            else:
+                col[key] = np.full(n, default)
+        if 'weight' in users and 'height' in users:
+            # Rows without a bmi but with both measurements derive it, as calculate_risk_score does
+            missing = users['bmi'].isna().to_numpy() if 'bmi' in users else np.ones(n, bool)
+            derived = _bmi(users['weight'].to_numpy(np.float64), users['height'].to_numpy(np.float64))
+            col['bmi'] = np.where(missing & ~np.isnan(derived), derived, col['bmi'])
+        age, bmi = col['age'], col['bmi']
+        
+        kernel = _scoring() if n >= _KERNEL_MIN_ROWS else None
+        if kernel is not None:
+            # Compiled parallel loop over rows; yes/no factors travel as one packed uint8
+            flags = kernel.pack_flags(col['family_history'].astype(bool), ~col['regular_exercise'].astype(bool),
+                                      col['high_bp'].astype(bool), col['high_glucose'].astype(bool))
+            score = kernel.score_kernel(np.asarray(age, np.float64), np.asarray(bmi, np.float64), flags)
         else:
-            risk_level = "High Risk"
-            risk_percentage = min(60 + (score - 60) * 1.2, 90)
+            score = (
+                np.where(age >= 45, 20, np.where(age >= 35, 10, 0))           # Age
+                + np.select([bmi >= 30, bmi >= 25, bmi >= 23], [30, 20, 10], 0)  # BMI
+                + 25 * col['family_history'].astype(bool)                      # Family history
+                + 15 * ~col['regular_exercise'].astype(bool)                   # Physical activity
+                + 15 * col['high_bp'].astype(bool)                             # High blood pressure
+                + 20 * col['high_glucose'].astype(bool)                        # Previous high glucose
+            )
+        
+        # Determine risk level and percentage by table lookup on the score bin
+        i = np.searchsorted(_RISK_BINS, score)
+        base = _RISK_BASE[i]
+        risk_level = _RISK_LEVELS[i]
+        risk_percentage = np.minimum(base + (score - base) * _RISK_SLOPE[i], _RISK_CAP[i]).astype(int)
+        
+        return score, risk_level, risk_percentage
+    
+    def score_dispatch(self, records):
+        """
+        Score a list of user_data dicts on the cheapest path for its size.
+        
+        Args:
+            records (list): user_data dicts
+            
+        Returns:
+            tuple: (risk_scores, risk_levels, risk_percentages) as NumPy arrays
+        """
+        if len(records) >= _BATCH_MIN_ROWS:
+            return self.calculate_risk_score_batch(pd.DataFrame.from_records(records))
         
-        return score, risk_level, int(risk_percentage)
+        rows = [self.calculate_risk_score(record) for record in records]
+        scores, levels, percentages = zip(*rows) if rows else ((), (), ())
+        return np.array(scores, int), np.array(levels, _RISK_LEVELS.dtype), np.array(percentages, int)
     
     def render_welcome_page(self):
         """Render the welcome/landing page of the application."""
@@ -198,9 +498,7 @@ class DiabetesRiskPredictor:
             **Ready to start your health assessment?**
             """)
             
-            if st.button("🚀 Start Assessment", type="primary", use_container_width=True):
-                st.session_state.current_page = "assessment"
-                st.rerun()
+            _nav_button("🚀 Start Assessment", "assessment", type="primary", use_container_width=True)
         
         with col2:
             st.image("https://via.placeholder.com/300x400/4CAF50/FFFFFF?text=Health+Icon", 
@@ -245,7 +543,7 @@ class DiabetesRiskPredictor:
             
             if submitted:
                 # Calculate BMI
-                bmi = weight / ((height / 100) ** 2)
+                bmi = _bmi(weight, height)
                 
                 # Store user data
                 user_data = {
@@ -271,39 +569,33 @@ class DiabetesRiskPredictor:
                 st.session_state.risk_percentage = risk_percentage
                 st.session_state.assessment_completed = True
                 
-                # Add to history
+                # Add to history (date stored as datetime64 now, formatted only for display)
                 assessment_record = {
-                    'date': datetime.now().strftime("%Y-%m-%d"),
+                    'date': np.datetime64('today', 'D'),
                     'risk_level': risk_level,
                     'risk_percentage': risk_percentage,
                     'bmi': round(bmi, 1)
                 }
-                st.session_state.assessment_history.append(assessment_record)
+                _append_history(st.session_state.assessment_history, assessment_record)
                 
                 st.session_state.current_page = "results"
                 st.rerun()
     
     def render_results_page(self):
         """Render the risk assessment results page."""
-        if not st.session_state.assessment_completed:
+        ss = st.session_state
+        if not ss.assessment_completed:
             st.warning("Please complete the assessment first.")
             return
         
-        risk_level = st.session_state.risk_level
-        risk_percentage = st.session_state.risk_percentage
+        risk_level, risk_percentage = ss.risk_level, ss.risk_percentage
+        i = _RISK_INDEX.get(risk_level, 2)
         
         st.markdown('<div class="main-header">Your Diabetes Risk</div>', unsafe_allow_html=True)
         
         # Risk level display
-        if "Low" in risk_level:
-            st.markdown(f'<div class="risk-low"><h2>{risk_level}</h2><p>Risk Percentage: {risk_percentage}%</p></div>', 
-                       unsafe_allow_html=True)
-        elif "Medium" in risk_level:
-            st.markdown(f'<div class="risk-medium"><h2>{risk_level}</h2><p>Risk Percentage: {risk_percentage}%</p></div>', 
-                       unsafe_allow_html=True)
-        else:
-            st.markdown(f'<div class="risk-high"><h2>{risk_level}</h2><p>Risk Percentage: {risk_percentage}%</p></div>', 
-                       unsafe_allow_html=True)
+        st.markdown(_RISK_BANNER_HTML[i].format(risk_level=risk_level, risk_percentage=risk_percentage),
+                   unsafe_allow_html=True)
         
         # Risk explanation
         col1, col2 = st.columns([2, 1])
@@ -311,256 +603,124 @@ class DiabetesRiskPredictor:
         with col1:
             st.markdown("### Understanding Your Risk")
             
-            if "Low" in risk_level:
-                st.success("""
-                **Great news!** You have a low risk of developing type 2 diabetes in the next 10 years. Continue to maintain a healthy lifestyle to keep your risk low.
-                """)
-            elif "Medium" in risk_level:
-                st.warning("""
-                **Attention needed.** Based on your responses, your risk is considered medium. This means you have a higher likelihood of developing type 2 diabetes compared to the general population, but there are steps you can take to reduce your risk.
-                """)
-            else:
-                st.error("""
-                **Important consultation needed.** Your risk of developing type 2 diabetes is high. This means you have several risk factors that significantly increase your likelihood of developing the condition. It's important to consult a healthcare professional for further evaluation and personalized advice.
-                """)
+            _RISK_ALERTS[i](_RISK_EXPLANATIONS[i])
         
         with col2:
-            # Risk gauge chart
-            fig = go.Figure(go.Indicator(
-                mode = "gauge+number",
-                value = risk_percentage,
-                domain = {'x': [0, 1], 'y': [0, 1]},
-                title = {'text': "Risk Level"},
-                gauge = {
-                    'axis': {'range': [None, 100]},
-                    'bar': {'color': "darkblue"},
-                    'steps': [
-                        {'range': [0, 30], 'color': "lightgreen"},
-                        {'range': [30, 60], 'color': "yellow"},
-                        {'range': [60, 100], 'color': "red"}
-                    ],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': 90
-                    }
-                }
-            ))
-            fig.update_layout(height=300)
-            st.plotly_chart(fig, use_container_width=True)
+            self.render_risk_gauge(risk_percentage)
         
         # Action buttons
-        col3, col4, col5 = st.columns(3)
-        with col3:
-            if st.button("📋 View Recommendations", use_container_width=True):
-                st.session_state.current_page = "recommendations"
-                st.rerun()
-        
-        with col4:
-            if st.button("📊 Health Dashboard", use_container_width=True):
-                st.session_state.current_page = "dashboard"
-                st.rerun()
-        
-        with col5:
-            if st.button("🔄 New Assessment", use_container_width=True):
-                st.session_state.current_page = "assessment"
-                st.rerun()
+        _nav_row(_RESULTS_NAV)
+    
+    def render_risk_gauge(self, risk_percentage):
+        """Render the risk gauge chart."""
+        st.plotly_chart(_gauge_fig(risk_percentage), use_container_width=True)
     
     def render_recommendations_page(self):
         """Render personalized recommendations based on risk assessment."""
+        ss = st.session_state
         st.markdown('<div class="main-header">Your Health Recommendations</div>', unsafe_allow_html=True)
         
-        if not st.session_state.assessment_completed:
+        if not ss.assessment_completed:
             st.warning("Please complete the assessment to view personalized recommendations.")
             return
         
-        user_data = st.session_state.user_data
-        risk_level = st.session_state.risk_level
+        user_data, risk_level = ss.user_data, ss.risk_level
         
-        st.markdown("### Lifestyle Recommendations")
+        self.render_recommendation_cards(user_data, risk_level)
         
-        # Physical Activity Recommendations
-        st.markdown('<div class="recommendation-card">', unsafe_allow_html=True)
-        st.markdown("#### 🏃‍♂️ Regular Physical Activity")
-        if not user_data.get('regular_exercise', True):
-            st.markdown("""
-            - Aim for at least 150 minutes of moderate-intensity aerobic activity per week, such as brisk walking
-            - Include muscle-strengthening activities on 2 or more days per week
-            - Start slowly and gradually increase duration and intensity
-            """)
-        else:
-            st.markdown("""
-            - Excellent! Continue your current exercise routine
-            - Consider adding variety with different types of activities
-            - Monitor your progress and set new fitness goals
-            """)
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Diet Recommendations
-        st.markdown('<div class="recommendation-card">', unsafe_allow_html=True)
-        st.markdown("#### 🥗 Adequate Sleep")
-        st.markdown("""
-        - Aim for 7-9 hours of quality sleep each night to support overall health and well-being
-        - Maintain a consistent sleep schedule
-        - Create a relaxing bedtime routine
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Stress Management
-        st.markdown('<div class="recommendation-card">', unsafe_allow_html=True)
-        st.markdown("#### 🧘‍♀️ Stress Management")
-        if user_data.get('stress_level', 'Low') == 'High':
-            st.markdown("""
-            - Practice stress-reduction techniques like meditation, yoga, or deep breathing
-            - Consider counseling or therapy for persistent stress
-            - Engage in hobbies and activities you enjoy
-            """)
-        else:
-            st.markdown("""
-            - Continue managing stress with healthy coping strategies
-            - Stay connected with friends and family
-            - Maintain work-life balance
-            """)
-        st.markdown('</div>', unsafe_allow_html=True)
+        # Navigation
+        _nav_row(_RECOMMENDATIONS_NAV)
+    
+    def render_recommendation_cards(self, user_data, risk_level):
+        """Render the recommendation cards."""
+        st.markdown("### Lifestyle Recommendations")
         
-        # Weight Management
+        # One markdown element per card: opening div, content and closing div together
+        cards = [
+            _REC_EXERCISE_OK if user_data.get('regular_exercise', True) else _REC_EXERCISE_LOW,
+            _REC_SLEEP,
+            _REC_STRESS_HIGH if user_data.get('stress_level', 'Low') == 'High' else _REC_STRESS_OK,
+        ]
         if user_data.get('bmi', 0) > 25:
-            st.markdown('<div class="recommendation-card">', unsafe_allow_html=True)
-            st.markdown("#### ⚖️ Weight Management")
-            st.markdown("""
-            - Focus on maintaining a healthy weight through a balanced diet and regular physical activity
-            - Consider consulting with a healthcare provider or registered dietitian
-            - Aim for gradual, sustainable weight loss if needed
-            """)
-            st.markdown('</div>', unsafe_allow_html=True)
+            cards.append(_REC_WEIGHT)
+        if _RISK_INDEX.get(risk_level) == 2:
+            cards.append(_REC_MEDICAL)
         
-        # Medical Follow-up
-        if "High" in risk_level:
-            st.markdown('<div class="recommendation-card">', unsafe_allow_html=True)
-            st.markdown("#### 🩺 Medical Follow-up")
-            st.markdown("""
-            - **Important:** Consult with your healthcare provider for further evaluation
-            - Regular check-ups and monitoring are recommended
-            - Discuss preventive measures and early intervention strategies
-            """)
-            st.markdown('</div>', unsafe_allow_html=True)
+        for card in cards:
+            st.markdown(card, unsafe_allow_html=True)
+    
+    def render_risk_trends(self, history, n):
+        """Render the risk trend chart and indicator."""
+        ss = st.session_state
+        st.markdown("### Risk Trends")
         
-        # Navigation
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("← Back to Results", use_container_width=True):
-                st.session_state.current_page = "results"
-                st.rerun()
-        with col2:
-            if st.button("Health Dashboard →", use_container_width=True):
-                st.session_state.current_page = "dashboard"
-                st.rerun()
+        if n > 1:
+            # Create trend chart straight from the history columns
+            st.plotly_chart(_trend_fig(history['date'][:n], history['risk_percentage'][:n]),
+                           use_container_width=True)
+            
+            # Risk level indicator
+            current_risk = ss.risk_level
+            _RISK_ALERTS[_RISK_INDEX.get(current_risk, 2)](f"Current Risk Level: **{current_risk}**")
+        else:
+            # Sample trend chart for demonstration
+            current = ss.risk_percentage if ss.assessment_completed else None
+            st.plotly_chart(_sample_trend_fig(current), use_container_width=True)
+            
+            st.markdown(_SAMPLE_TREND_HTML, unsafe_allow_html=True)
     
     def render_dashboard_page(self):
         """Render the health tracking dashboard."""
+        ss = st.session_state
         st.markdown('<div class="main-header">My Health Dashboard</div>', unsafe_allow_html=True)
         
         # Past Assessments Section
         st.markdown("### Past Assessments")
         
-        if st.session_state.assessment_history:
-            for i, assessment in enumerate(st.session_state.assessment_history):
-                st.markdown(f'<div class="assessment-item">', unsafe_allow_html=True)
-                col1, col2, col3 = st.columns([2, 2, 1])
-                with col1:
-                    st.markdown(f"**Assessment on {assessment['date']}**")
-                with col2:
-                    st.markdown(f"Risk Level: **{assessment['risk_level']}**")
-                with col3:
-                    st.markdown(f"BMI: {assessment['bmi']}")
-                st.markdown('</div>', unsafe_allow_html=True)
+        history = ss.assessment_history
+        n = history['_len']
+        
+        if n:
+            st.dataframe(
+                pd.DataFrame({
+                    'Date': history['date'][:n],
+                    'Risk Level': history['risk_level'][:n],
+                    'Risk Percentage (%)': history['risk_percentage'][:n],
+                    'BMI': history['bmi'][:n]
+                }),
+                hide_index=True,
+                use_container_width=True,
+                column_config={'BMI': st.column_config.NumberColumn(format="%.1f")}
+            )
         else:
             st.info("No assessment history available. Complete an assessment to see your results here.")
         
         # Risk Trends Section
-        st.markdown("### Risk Trends")
-        
-        if len(st.session_state.assessment_history) > 1:
-            # Create trend chart
-            df = pd.DataFrame(st.session_state.assessment_history)
-            df['date'] = pd.to_datetime(df['date'])
-            
-            fig = px.line(df, x='date', y='risk_percentage', 
-                         title='Risk Level Over Time',
-                         labels={'risk_percentage': 'Risk Percentage (%)', 'date': 'Date'})
-            fig.update_traces(line_color='#2E8B57', line_width=3)
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Risk level indicator
-            current_risk = st.session_state.risk_level
-            if "Low" in current_risk:
-                st.success(f"Current Risk Level: **{current_risk}**")
-            elif "Medium" in current_risk:
-                st.warning(f"Current Risk Level: **{current_risk}**")
-            else:
-                st.error(f"Current Risk Level: **{current_risk}**")
-        else:
-            # Sample trend chart for demonstration
-            dates = pd.date_range(start='2024-01-01', periods=6, freq='M')
-            sample_data = [25, 30, 28, 32, 29, st.session_state.risk_percentage if st.session_state.assessment_completed else 30]
-            
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(x=dates, y=sample_data[:5], 
-                                   mode='lines+markers',
-                                   name='Past Trend',
-                                   line=dict(color='lightgray', dash='dash')))
-            if st.session_state.assessment_completed:
-                fig.add_trace(go.Scatter(x=[dates[-1]], y=[sample_data[-1]], 
-                                       mode='markers',
-                                       name='Current',
-                                       marker=dict(color='red', size=10)))
-            
-            fig.update_layout(title='Risk Level Over Time', 
-                            xaxis_title='Date', 
-                            yaxis_title='Risk Percentage (%)',
-                            height=400)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            st.markdown(f'<div class="risk-medium"><h3>Risk Level Over Time</h3><p>Medium</p><p>Last 12 Months: -10%</p></div>', 
-                       unsafe_allow_html=True)
+        self.render_risk_trends(history, n)
         
         # Quick Actions
         st.markdown("### Quick Actions")
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            if st.button("🔄 New Assessment", use_container_width=True):
-                st.session_state.current_page = "assessment"
-                st.rerun()
-        
-        with col2:
-            if st.button("📋 View Recommendations", use_container_width=True):
-                st.session_state.current_page = "recommendations"
-                st.rerun()
-        
-        with col3:
-            if st.button("👤 Profile Settings", use_container_width=True):
-                st.session_state.current_page = "profile"
-                st.rerun()
+        _nav_row(_DASHBOARD_NAV)
     
     def render_profile_page(self):
         """Render user profile and settings page."""
+        ss = st.session_state
         st.markdown('<div class="main-header">Profile Settings</div>', unsafe_allow_html=True)
         
-        if st.session_state.user_data:
+        user_data = ss.user_data
+        if user_data:
             st.markdown("### Your Information")
             
             col1, col2 = st.columns(2)
             with col1:
-                st.metric("Age", f"{st.session_state.user_data.get('age', 'N/A')} years")
-                st.metric("Height", f"{st.session_state.user_data.get('height', 'N/A')} cm")
-                st.metric("BMI", f"{st.session_state.user_data.get('bmi', 0):.1f}")
+                st.metric("Age", f"{user_data.get('age', 'N/A')} years")
+                st.metric("Height", f"{user_data.get('height', 'N/A')} cm")
+                st.metric("BMI", f"{user_data.get('bmi', 0):.1f}")
             
             with col2:
-                st.metric("Weight", f"{st.session_state.user_data.get('weight', 'N/A')} kg")
-                st.metric("Sleep Hours", f"{st.session_state.user_data.get('sleep_hours', 'N/A')}")
-                st.metric("Stress Level", st.session_state.user_data.get('stress_level', 'N/A'))
+                st.metric("Weight", f"{user_data.get('weight', 'N/A')} kg")
+                st.metric("Sleep Hours", f"{user_data.get('sleep_hours', 'N/A')}")
+                st.metric("Stress Level", user_data.get('stress_level', 'N/A'))
         
         st.markdown("### App Settings")
         
@@ -569,89 +729,87 @@ class DiabetesRiskPredictor:
         
         # Data export
         if st.button("📊 Export Assessment Data"):
-            if st.session_state.assessment_history:
-                df = pd.DataFrame(st.session_state.assessment_history)
-                csv = df.to_csv(index=False)
+            history = ss.assessment_history
+            n = history['_len']
+            if n:
+                # Write rows straight from the column arrays; no DataFrame in between
+                buf = io.StringIO()
+                writer = csv.writer(buf)
+                writer.writerow(_HISTORY_DTYPES)
+                writer.writerows(zip(history['date'][:n].astype(str), history['risk_level'][:n],
+                                     history['risk_percentage'][:n], history['bmi'][:n]))
                 st.download_button(
                     label="Download CSV",
-                    data=csv,
+                    data=buf.getvalue(),
                     file_name="diabetes_risk_assessments.csv",
                     mime="text/csv"
                 )
             else:
                 st.warning("No assessment data to export.")
         
-        # Reset data
+        # Reset data (the first click arms the confirm button for the next run)
         if st.button("🗑️ Clear All Data", type="secondary"):
+            ss.confirm_reset = True
+        if ss.get('confirm_reset'):
             if st.button("Confirm Reset", type="secondary"):
-                # Reset session state
-                for key in list(st.session_state.keys()):
-                    del st.session_state[key]
+                # Reset session state in one call, then restore the defaults
+                ss.clear()
+                self.initialize_session_state()
                 st.success("All data cleared successfully!")
                 st.rerun()
         
         # Navigation
-        if st.button("← Back to Dashboard", use_container_width=True):
-            st.session_state.current_page = "dashboard"
-            st.rerun()
+        _nav_button("← Back to Dashboard", "dashboard", use_container_width=True)
     
+    @st.fragment
     def render_navigation(self):
-        """Render the sidebar navigation menu."""
-        with st.sidebar:
-            st.markdown("## 🩺 Diabetes Risk Assessement App")
-            st.markdown("---")
+        """Render the sidebar navigation menu; call inside ``with st.sidebar``."""
+        ss = st.session_state
+        st.markdown("## 🩺 Diabetes Risk Assessement App")
+        st.markdown("---")
+        
+        # Navigation menu
+        current_page = ss.current_page
+        for label, page in MENU_ITEMS:
+            _nav_button(label, page, key=f"menu_{page}", use_container_width=True,
+                        type="primary" if current_page == page else "secondary")
+        
+        st.markdown("---")
+        
+        # Show current risk level if assessment completed
+        if ss.assessment_completed:
+            st.markdown("### Current Status")
+            risk_level, risk_percentage = ss.risk_level, ss.risk_percentage
             
-            # Navigation menu
-            menu_items = {
-                "🏠 Home": "welcome",
-                "📝 Assessment": "assessment", 
-                "📊 Results": "results",
-                "💡 Recommendations": "recommendations",
-                "📈 Dashboard": "dashboard",
-                "👤 Profile": "profile"
-            }
-            
-            for label, page in menu_items.items():
-                if st.button(label, use_container_width=True, 
-                           type="primary" if st.session_state.current_page == page else "secondary"):
-                    st.session_state.current_page = page
-                    st.rerun()
+            _RISK_ALERTS[_RISK_INDEX.get(risk_level, 2)](f"Risk: {risk_level}")
             
-            st.markdown("---")
-            
-            # Show current risk level if assessment completed
-            if st.session_state.assessment_completed:
-                st.markdown("### Current Status")
-                risk_level = st.session_state.risk_level
-                risk_percentage = st.session_state.risk_percentage
-                
-                if "Low" in risk_level:
-                    st.success(f"Risk: {risk_level}")
-                elif "Medium" in risk_level:
-                    st.warning(f"Risk: {risk_level}")
-                else:
-                    st.error(f"Risk: {risk_level}")
-                
-                st.metric("Risk Percentage", f"{risk_percentage}%")
+            st.metric("Risk Percentage", f"{risk_percentage}%")
+    
+    # Page key -> renderer, looked up once per rerun in run()
+    _ROUTES = {
+        "welcome": render_welcome_page,
+        "assessment": render_assessment_page,
+        "results": render_results_page,
+        "recommendations": render_recommendations_page,
+        "dashboard": render_dashboard_page,
+        "profile": render_profile_page
+    }
     
     def run(self):
         """Main application runner."""
+        st.markdown(_CSS, unsafe_allow_html=True)
+        
         # Render navigation
-        self.render_navigation()
-        
-        # Render current page
-        if st.session_state.current_page == "welcome":
-            self.render_welcome_page()
-        elif st.session_state.current_page == "assessment":
-            self.render_assessment_page()
-        elif st.session_state.current_page == "results":
-            self.render_results_page()
-        elif st.session_state.current_page == "recommendations":
-            self.render_recommendations_page()
-        elif st.session_state.current_page == "dashboard":
-            self.render_dashboard_page()
-        elif st.session_state.current_page == "profile":
-            self.render_profile_page()
+        with st.sidebar:
+            self.render_navigation()
+        
+        # Keep the URL in step with the route; only written when it changes
+        page = st.session_state.current_page
+        if st.query_params.get("page") != page:
+            st.query_params["page"] = page
+        
+        # Render current page (unknown keys fall back to the welcome page)
+        self._ROUTES.get(page, DiabetesRiskPredictor.render_welcome_page)(self)
 
 # Application entry point
 if __name__ == "__main__":
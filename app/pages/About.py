@@ -0,0 +1,43 @@
+"""
+About page: app description, key features, technology stack and the
+medical disclaimer.
+"""
+
+import streamlit as st
+from state import ensure_state
+
+st.set_page_config(page_title="About", page_icon="ℹ️", layout="centered")
+ensure_state()
+
+@st.cache_data(persist="disk", show_spinner=False)
+def _about_markdown() -> str:
+    return """
+    ### About This Application
+    
+    Add your app description, features, and information here.
+    
+    #### Key Features
+    - Feature 1
+    - Feature 2
+    - Feature 3
+    
+    #### Technology Stack
+    - Streamlit
+    - Python
+    - Machine Learning
+    
+    #### Disclaimer
+    Add your medical disclaimers and legal information here.
+    """
+
+def show_about():
+    """About page skeleton"""
+    st.title("ℹ️ About")
+    st.info("ℹ️ **ABOUT PAGE** - Add your app information here")
+
+    st.markdown(_about_markdown())
+
+show_about()
+
+st.divider()
+st.page_link("Home.py", label="← Back to Home")
@@ -0,0 +1,50 @@
+"""
+Analytics page: skeleton dashboard with a metrics row and two chart areas.
+Add your analytics and insights here.
+"""
+
+import streamlit as st
+from pathlib import Path
+from state import ensure_state, assessment_count
+
+st.set_page_config(page_title="Analytics", page_icon="📊", layout="centered")
+ensure_state()
+
+DATASET_PATH = Path(__file__).resolve().parents[2] / "models" / "diabetes_nigeria.csv"
+
+@st.cache_data(ttl=3600, max_entries=4, show_spinner=False)
+def load_dataset():
+    """Parse the reference dataset at most once an hour, shared by all sessions."""
+    import pandas as pd
+    return pd.read_csv(DATASET_PATH)
+
+@st.fragment
+def show_analytics():
+    """Analytics page skeleton"""
+    st.title("📊 Analytics Dashboard")
+    st.info("📊 **ANALYTICS PAGE** - Add your analytics and insights here")
+
+    df = load_dataset()
+
+    # Metrics row: (label, value, delta), one column per record. The reference
+    # metrics describe the training dataset, not app users; Predictions is
+    # this session's assessment count.
+    metrics = (
+        ("Reference Records", len(df), None),
+        ("Predictions", assessment_count(), None),
+        ("Accuracy", "0%", "0%"),
+        ("Positive Outcomes", int(df["Outcome"].sum()), None),
+    )
+    for col, (label, value, delta) in zip(st.columns(len(metrics)), metrics):
+        col.metric(label, value, delta)
+
+    # Charts area (native bordered containers, no inline HTML/CSS)
+    st.markdown("### Analytics Charts")
+    col1, col2 = st.columns(2)
+    col1.container(height=250, border=True).caption("Chart 1 Area")
+    col2.container(height=250, border=True).caption("Chart 2 Area")
+
+show_analytics()
+
+st.divider()
+st.page_link("Home.py", label="← Back to Home")
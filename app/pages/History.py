@@ -0,0 +1,35 @@
+"""
+History page: skeleton list of previous predictions with an empty state.
+Add your data table/history display here.
+"""
+
+import streamlit as st
+from state import ensure_state
+
+st.set_page_config(page_title="History", page_icon="📋", layout="centered")
+ensure_state()
+
+# Static body (heading, blurb, empty state) sent as a single markdown element
+_HISTORY_BODY_HTML = """
+### Previous Predictions
+Add your data table/history display here
+
+<div style="text-align: center; padding: 3rem; color: #999;">
+    <h4>No predictions yet</h4>
+    <p>Make your first prediction to see history here</p>
+</div>
+"""
+
+@st.fragment
+def show_history():
+    """History page skeleton"""
+    st.title("📋 Prediction History")
+    st.info("📋 **HISTORY PAGE** - Add your history tracking here")
+
+    # Placeholder table + sample empty state
+    st.markdown(_HISTORY_BODY_HTML, unsafe_allow_html=True)
+
+show_history()
+
+st.divider()
+st.page_link("Home.py", label="← Back to Home")
@@ -0,0 +1,45 @@
+"""
+Input page: skeleton patient-information form.
+Add the questionnaire fields your model needs inside the form.
+"""
+
+import streamlit as st
+from state import ensure_state
+
+st.set_page_config(page_title="Patient Input", page_icon="📝", layout="centered")
+ensure_state()
+
+def show_input():
+    """Input page skeleton
+
+    Every input widget must live inside the ``patient_form`` block: values
+    are only sent to the server when the submit button is pressed, so
+    typing does not rerun the script. Keep new fields inside the form.
+    """
+    st.title("📝 Patient Information")
+    st.info("📝 **INPUT PAGE** - Add your form components here")
+
+    # Basic form skeleton (all widgets batched until submit)
+    with st.form("patient_form"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("Section 1")
+            st.text_input("Field 1", placeholder="Add your input fields")
+            st.number_input("Field 2", value=0)
+
+        with col2:
+            st.subheader("Section 2")
+            st.text_input("Field 3", placeholder="Add your input fields")
+            st.selectbox("Field 4", ["Option 1", "Option 2"])
+
+        submitted = st.form_submit_button("Submit", use_container_width=True)
+
+    # Handle the submission outside the form; only runs on the submit rerun
+    if submitted:
+        st.success("Form submitted! Add your processing logic here.")
+
+show_input()
+
+st.divider()
+st.page_link("Home.py", label="← Back to Home")
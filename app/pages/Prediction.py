@@ -0,0 +1,44 @@
+"""
+Prediction page: skeleton results layout with a chart area and a
+summary panel. Wire in the model output and visualisations here.
+"""
+
+import streamlit as st
+from state import ensure_state
+from utils import get_model
+
+st.set_page_config(page_title="Prediction", page_icon="🔍", layout="centered")
+ensure_state()
+
+_TWO_ONE = (2, 1)  # st.columns ratio: results area | summary panel
+
+@st.fragment
+def show_prediction():
+    """Prediction page skeleton"""
+    model = get_model()
+    st.title("🔍 Prediction Results")
+    st.info("🔍 **PREDICTION PAGE** - Add your results display here")
+
+    col1, col2 = st.columns(_TWO_ONE)
+
+    with col1:
+        st.markdown("### Main Results Area")
+        st.markdown("Add your charts, gauges, or result displays here")
+
+        # Placeholder chart area (native bordered container, no inline HTML/CSS)
+        st.container(height=300, border=True).caption("Chart/Visualization Area")
+
+    with col2:
+        st.markdown("### Summary Panel")
+        st.markdown("Add result summary, recommendations, etc.")
+        if model is None:
+            st.caption("No trained model found; the rule-based fallback will be used.")
+
+        # Placeholder metrics
+        st.metric("Metric 1", "Value")
+        st.metric("Metric 2", "Value")
+
+show_prediction()
+
+st.divider()
+st.page_link("Home.py", label="← Back to Home")
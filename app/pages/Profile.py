@@ -4,45 +4,80 @@ mirroring the table + trend visual in your mockups.  :contentReference[oaicite:7
 """
 
 import streamlit as st
-from state import ensure_state, ASSESSMENTS_KEY
-import pandas as pd
-import matplotlib.pyplot as plt
-from io import StringIO
-from datetime import datetime
+from state import ensure_state, assessment_count, ASSESSMENTS_KEY, ASSESSMENT_FIELDS, SESSION_ID_KEY
+from utils import calc_bmi_arr
+from io import BytesIO
+
+import numpy as np
 
 st.set_page_config(page_title="Profile", page_icon="👤", layout="centered")
 ensure_state()
 
+# Derived objects below are cached on history_key = (session id, row count,
+# latest created_at): it changes exactly when save_assessment appends a row,
+# and the session id keeps the process-wide cache from serving one visitor's
+# history to another.
+# pandas is imported inside them, so a visitor with no history (or a
+# cache hit) never pays for loading it.
+@st.cache_data(show_spinner=False, max_entries=8)
+def _history_df(history_key: tuple, _assessments: dict) -> "pd.DataFrame":
+    """History as a DataFrame with parsed timestamps, oldest first; rebuilt only on a new key."""
+    import pandas as pd
+    _, n, _ = history_key
+    df = pd.DataFrame({f: _assessments[f][:n] for f in ASSESSMENT_FIELDS}, copy=False)  # views of the filled rows
+    # created_at is an int64 epoch-ns timestamp: one vectorised conversion, no parsing
+    df["created_at"] = pd.to_datetime(df["created_at"], unit="ns", utc=True)
+    # Keep the BMI the prediction used; derive it only for rows saved without one
+    missing = df["bmi"].isna().to_numpy()
+    if missing.any():
+        df.loc[missing, "bmi"] = calc_bmi_arr(df["weight"][missing], df["height"][missing]).astype(np.float32)
+    # Sorted oldest-first, once; stable so equal timestamps keep insertion order
+    return df.sort_values("created_at", kind="mergesort", ignore_index=True)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _history_export(history_key: tuple, fmt: str, _df: "pd.DataFrame") -> bytes:
+    """Serialise the history once per (history_key, format)."""
+    if fmt == "parquet":
+        buf = BytesIO()
+        _df.to_parquet(buf, index=False, compression="zstd", compression_level=1)
+        return buf.getvalue()
+    return _df.to_csv(index=False).encode()
+
 st.title("My Health")
 
 assessments = st.session_state[ASSESSMENTS_KEY]
-if not assessments:
+n_assessments = assessment_count()
+if not n_assessments:
     st.info("No past assessments yet. Complete an assessment to see history.")
     st.page_link("pages/1_🔎_Risk_Assessment.py", label="Start Assessment")
     st.stop()
 
-df = pd.DataFrame(assessments)
-df["created_at"] = pd.to_datetime(df["created_at"])
+history_key = (st.session_state[SESSION_ID_KEY], n_assessments, int(assessments["created_at"][n_assessments - 1]))
+df = _history_df(history_key, assessments)
 
 st.subheader("Past Assessments")
 st.dataframe(
-    df[["created_at", "risk_label", "risk_prob", "age", "weight", "height", "bmi"]]
-      .sort_values("created_at", ascending=False),
+    df.iloc[::-1][["created_at", "risk_label", "risk_prob", "age", "weight", "height", "bmi"]],  # newest first
     use_container_width=True
 )
 
 st.subheader("Risk Level Over Time")
-fig, ax = plt.subplots()  # NOTE: one chart per plot, no seaborn, no style set (per restrictions)
-df_sort = df.sort_values("created_at")
-ax.plot(df_sort["created_at"], df_sort["risk_prob"])
-ax.set_xlabel("Date")
-ax.set_ylabel("Risk Probability")
-ax.set_title("Risk Trend (0–1)")
-st.pyplot(fig)
-
-# Simple export
-csv = df.to_csv(index=False)
-st.download_button("Download Assessment History (CSV)", data=csv, file_name="assessments.csv", mime="text/csv")
+# Vega-Lite draws the line in the browser; the server only sends the data
+st.line_chart(df.set_index("created_at")[["risk_prob"]], x_label="Date", y_label="Risk Probability")
+
+# Export: Parquet by default, CSV as a fallback. Both are cached, so each is
+# serialised once and reused until a new assessment is saved.
+col_parquet, col_csv = st.columns(2)
+col_parquet.download_button(
+    "Download Assessment History (Parquet)", type="primary",
+    data=_history_export(history_key, "parquet", df),
+    file_name="assessments.parquet", mime="application/octet-stream",
+)
+col_csv.download_button(
+    "Download as CSV",
+    data=_history_export(history_key, "csv", df),
+    file_name="assessments.csv", mime="text/csv",
+)
 
 st.divider()
 row = st.columns(3)
@@ -11,13 +11,13 @@ from utils import lifestyle_recommendations, dietary_recommendations
 st.set_page_config(page_title="Recommendations", page_icon="📝", layout="centered")
 ensure_state()
 
-st.title("Your Health Recommendations")
-
-st.header("Lifestyle")
-st.markdown(lifestyle_recommendations())
+@st.cache_data(show_spinner=False)
+def _recs_markdown() -> str:
+    """Both guidance sections (headings included) as one markdown block."""
+    return f"## Lifestyle\n{lifestyle_recommendations()}\n\n## Dietary\n{dietary_recommendations()}"
 
-st.header("Dietary")
-st.markdown(dietary_recommendations())
+st.title("Your Health Recommendations")
+st.markdown(_recs_markdown())
 
 st.divider()
 row = st.columns(3)
@@ -7,9 +7,9 @@ into Low / Medium / High categories, and then navigates to the Results page.
 """
 
 import streamlit as st
-from state import ensure_state, CURRENT_FORM_KEY, CURRENT_RESULT_KEY
+from state import ensure_state, FormSnapshot, CURRENT_FORM_KEY, CURRENT_RESULT_KEY
 from utils import calc_bmi, model_predict_prob, label_from_prob
-from datetime import datetime
+import time
 
 # Page configuration
 st.set_page_config(page_title="Risk Assessment", page_icon="🔎", layout="centered")
@@ -59,8 +59,8 @@ if submitted:
     st.session_state[CURRENT_RESULT_KEY] = {
         "prob": prob,
         "label": label,
-        "created_at": datetime.utcnow().isoformat(),
-        "inputs": form.copy(),
+        "created_at": time.time_ns(),  # epoch ns; formatted only for display
+        "inputs": FormSnapshot.from_form(form),
     }
 
     # Navigate to results page
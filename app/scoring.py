@@ -0,0 +1,43 @@
+"""
+Compiled risk-score kernel for bulk re-scoring (used by leggo.py).
+Lives in its own module so it is compiled once per process rather than on
+every Streamlit rerun of the page script. leggo.py imports it only for
+batches large enough to use the kernel, which compiles (or loads from
+numba's on-disk cache) on its first call. Without numba installed,
+NUMBA_AVAILABLE is False and callers keep their NumPy path.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Bit positions of the packed yes/no risk factors in the uint8 flags column
+FAMILY_HISTORY, NO_EXERCISE, HIGH_BP, HIGH_GLUCOSE = 0, 1, 2, 3
+
+def pack_flags(family_history, no_exercise, high_bp, high_glucose) -> np.ndarray:
+    """Pack four boolean columns into one uint8 column, one bit per factor."""
+    flags = np.asarray(family_history, np.uint8) << FAMILY_HISTORY
+    flags |= np.asarray(no_exercise, np.uint8) << NO_EXERCISE
+    flags |= np.asarray(high_bp, np.uint8) << HIGH_BP
+    flags |= np.asarray(high_glucose, np.uint8) << HIGH_GLUCOSE
+    return flags
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def score_kernel(age, bmi, flags):
+        """Risk points per row; same rules as DiabetesRiskPredictor.calculate_risk_score."""
+        out = np.empty(age.size, np.int16)
+        for i in prange(age.size):
+            a, b, f = age[i], bmi[i], flags[i]
+            s = 20 if a >= 45 else 10 if a >= 35 else 0
+            s += 30 if b >= 30 else 20 if b >= 25 else 10 if b >= 23 else 0
+            s += 25 * ((f >> FAMILY_HISTORY) & 1) + 15 * ((f >> NO_EXERCISE) & 1)
+            s += 15 * ((f >> HIGH_BP) & 1) + 20 * ((f >> HIGH_GLUCOSE) & 1)
+            out[i] = s
+        return out
+else:
+    score_kernel = None
@@ -4,17 +4,55 @@ Keeps all page files consistent and avoids key typos.
 """
 
 import streamlit as st
-from typing import Dict, Any, List
-from datetime import datetime
+from dataclasses import dataclass, fields
+from typing import Dict, Any, Optional
+import time
+import uuid
 
-ASSESSMENTS_KEY = "assessments"     # list of dicts, each a completed assessment
+import numpy as np
+
+ASSESSMENTS_KEY = "assessments"     # dict of typed column arrays plus '_len', one row per completed assessment
 CURRENT_FORM_KEY = "current_form"   # dict of in-progress inputs
-CURRENT_RESULT_KEY = "current_result"  # dict with 'prob' (0-1), 'label', 'created_at'
+CURRENT_RESULT_KEY = "current_result"  # dict with 'prob' (0-1), 'label', 'created_at' (epoch ns), 'inputs' (FormSnapshot)
+SESSION_ID_KEY = "_session_id"      # random hex id, scopes process-wide caches to this session
+INITIALISED_KEY = "_initialized"    # sentinel set once the containers above exist
+
+# Columns of the assessment history (struct of arrays: row i is the i-th entry
+# of each, the first '_len' rows are filled, capacity doubles when full).
+# Measurements are float32: 4 bytes instead of a boxed Python float, and
+# exact to the form's 0.1 steps where float16 would turn 170.3 cm into 170.25.
+ASSESSMENT_DTYPES = {
+    "created_at": np.int64,     # epoch ns
+    "age": np.int16,
+    "weight": np.float32,
+    "height": np.float32,
+    "bmi": np.float32,
+    "risk_prob": np.float32,
+    "risk_label": "U6",
+}
+ASSESSMENT_FIELDS = tuple(ASSESSMENT_DTYPES)
+_ASSESSMENT_CAPACITY = 16
+
+@dataclass(frozen=True, slots=True)
+class FormSnapshot:
+    """Immutable copy of the submitted form inputs, stored with each result."""
+    age: int
+    weight: float
+    height: float
+    bmi: Optional[float]
+
+    @classmethod
+    def from_form(cls, form: Dict[str, Any]) -> "FormSnapshot":
+        return cls(**{f.name: form.get(f.name) for f in fields(cls)})
 
 def ensure_state() -> None:
     """Initialise session state containers once per session."""
+    if st.session_state.get(INITIALISED_KEY):
+        return
     if ASSESSMENTS_KEY not in st.session_state:
-        st.session_state[ASSESSMENTS_KEY]: List[Dict[str, Any]] = []
+        history: Dict[str, Any] = {f: np.empty(_ASSESSMENT_CAPACITY, dt) for f, dt in ASSESSMENT_DTYPES.items()}
+        history["_len"] = 0
+        st.session_state[ASSESSMENTS_KEY] = history
     if CURRENT_FORM_KEY not in st.session_state:
         st.session_state[CURRENT_FORM_KEY] = {
             "age": None, "weight": None, "height": None, "bmi": None,
@@ -22,12 +60,15 @@ def ensure_state() -> None:
         }
     if CURRENT_RESULT_KEY not in st.session_state:
         st.session_state[CURRENT_RESULT_KEY] = None
+    if SESSION_ID_KEY not in st.session_state:
+        st.session_state[SESSION_ID_KEY] = uuid.uuid4().hex
+    st.session_state[INITIALISED_KEY] = True
 
 def save_assessment(result: Dict[str, Any]) -> None:
     """Append a completed assessment (inputs + result) into history."""
     ensure_state()
     data = {
-        "created_at": result.get("created_at", datetime.utcnow().isoformat()),
+        "created_at": result.get("created_at", time.time_ns()),
         "age": st.session_state[CURRENT_FORM_KEY].get("age"),
         "weight": st.session_state[CURRENT_FORM_KEY].get("weight"),
         "height": st.session_state[CURRENT_FORM_KEY].get("height"),
@@ -35,7 +76,20 @@ def save_assessment(result: Dict[str, Any]) -> None:
         "risk_prob": result.get("prob"),
         "risk_label": result.get("label"),
     }
-    st.session_state[ASSESSMENTS_KEY].append(data)
+    history = st.session_state[ASSESSMENTS_KEY]
+    n = history["_len"]
+    if n == len(history["created_at"]):
+        for field in ASSESSMENT_FIELDS:
+            grown = np.empty(2 * n, history[field].dtype)
+            grown[:n] = history[field]
+            history[field] = grown
+    for field in ASSESSMENT_FIELDS:
+        history[field][n] = data[field]
+    history["_len"] = n + 1
+
+def assessment_count() -> int:
+    """Number of saved assessments."""
+    return st.session_state[ASSESSMENTS_KEY]["_len"]
 
 def clear_current() -> None:
     """Clear only the in-progress form and result."""
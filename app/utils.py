@@ -1,25 +1,40 @@
 """
 Utility functions:
-- BMI calculation
-- Model loading (optional)
+- Shared page config
+- BMI calculation (scalar for the form, vectorised for history tables)
+- Model loading (optional, cached once per process)
 - Risk inference (model-backed or rule-based fallback)
 - Text blocks for Results & Recommendations (Low/Medium/High)
 The labels and copy mirror the design screens.  :contentReference[oaicite:1]{index=1}
 """
 
-from typing import Optional, Tuple, Dict
+from typing import Optional, Tuple, Dict, List, Union
 import math
 import pickle
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+import streamlit as st
+
 MODEL_PATH = Path(__file__).parent / "model" / "model.pkl"
 
+# st.set_page_config(**PAGE_CFG) for the app entry point (Home.py)
+PAGE_CFG = dict(page_title="Diabetes Risk Predictor", page_icon="🩺", layout="centered")
+
 def calc_bmi(weight_kg: Optional[float], height_cm: Optional[float]) -> Optional[float]:
     if not weight_kg or not height_cm or height_cm <= 0:
         return None
     h_m = height_cm / 100.0
     return round(weight_kg / (h_m * h_m), 1)
 
+def calc_bmi_arr(weight_kg, height_cm) -> np.ndarray:
+    """Vectorised calc_bmi over whole columns; missing or non-positive heights give NaN."""
+    w = np.asarray(weight_kg, dtype=np.float64)
+    h_m = np.asarray(height_cm, dtype=np.float64) / 100.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.round(np.where(h_m > 0, w / (h_m * h_m), np.nan), 1)
+
 def load_model():
     try:
         if MODEL_PATH.exists():
@@ -29,45 +44,72 @@ def load_model():
         pass
     return None
 
-_model = load_model()
-
-def model_predict_prob(features: Dict) -> float:
-    """
-    Return probability (0..1). If a trained model is available, use it;
-    otherwise use a simple, interpretable fallback.
-    """
-    if _model is not None:
-        # Expect your real feature vector construction here:
-        # X = [[features["age"], features["bmi"], ...]]
-        # prob = _model.predict_proba(X)[0][1]
-        # For safety until user wires features:
+@st.cache_resource(show_spinner=False)
+def get_model():
+    """Unpickle the classifier once per process instead of at every import."""
+    return load_model()
+
+def _feature_matrix(batch: List[Dict]) -> np.ndarray:
+    """[age, bmi] per row, freshly built so concurrent sessions share nothing."""
+    rows = [(f.get("age") or 0, f.get("bmi") or 0) for f in batch]
+    return np.array(rows, dtype=np.float64).reshape(-1, 2)
+
+def _predict_probs(X: np.ndarray) -> np.ndarray:
+    model = get_model()
+    if model is not None:
+        # Expect your real feature vector construction here: X holds
+        # [age, bmi] per row; widen _feature_matrix when the model needs more.
         try:
             # Minimal example: if the model exposes 'predict_proba' and expects [age, bmi]
-            X = [[features.get("age", 0), features.get("bmi", 0)]]
-            prob = float(_model.predict_proba(X)[0][1])
-            return max(0.0, min(1.0, prob))
+            return np.clip(model.predict_proba(X)[:, 1], 0.0, 1.0)
         except Exception:
             pass
 
     # ---- Fallback risk score (very rough; replace with your model logic) ----
-    age = features.get("age") or 0
-    bmi = features.get("bmi") or 0
+    age, bmi = X[:, 0], X[:, 1]
 
     # Simple logistic-ish mapping
-    score = 0.0
-    score += (age - 30) * 0.01 if age > 30 else 0
-    score += (bmi - 25) * 0.02 if bmi > 25 else 0
-    score = max(0.0, min(1.0, score))
-    return score
+    score = np.where(age > 30, (age - 30) * 0.01, 0.0)
+    score += np.where(bmi > 25, (bmi - 25) * 0.02, 0.0)
+    return np.clip(score, 0.0, 1.0)
+
+def model_predict_prob(features_or_batch: Union[Dict, List[Dict]]) -> Union[float, np.ndarray]:
+    """
+    Return probability (0..1) for one feature dict, or an array of
+    probabilities for a list of dicts (one predict_proba call for the batch).
+    If a trained model is available, use it; otherwise use a simple,
+    interpretable fallback.
+    """
+    if isinstance(features_or_batch, dict):
+        age = features_or_batch.get("age") or 0
+        bmi = features_or_batch.get("bmi") or 0
+        return _predict_cached(round(age), round(bmi * 10))
+    return _predict_probs(_feature_matrix(features_or_batch))
+
+@lru_cache(maxsize=1024)
+def _predict_cached(age: int, bmi10: int) -> float:
+    """Single prediction memoised on age and BMI x 10 (calc_bmi rounds to 0.1)."""
+    return float(_predict_probs(_feature_matrix([{"age": age, "bmi": bmi10 / 10}]))[0])
+
+def reload_model() -> None:
+    """Drop the cached model (e.g. after retraining) and every prediction made with it."""
+    get_model.clear()
+    _predict_cached.cache_clear()
+
+# Risk bands: p < 0.34 is Low, p < 0.67 is Medium, otherwise High
+_LABEL_CUTS = np.array([0.34, 0.67])
+_LABELS = np.array(["Low", "Medium", "High"])
+
+def label_from_probs(p) -> np.ndarray:
+    """Vectorised label_from_prob: one searchsorted over all probabilities."""
+    return _LABELS[np.searchsorted(_LABEL_CUTS, p, side="right")]
 
 def label_from_prob(p: float) -> str:
-    if p < 0.34:
-        return "Low"
-    if p < 0.67:
-        return "Medium"
-    return "High"
+    return label_from_probs(p).item()
 
 # ---- Copy blocks ----
+# Risk and recommendation copy is memoised for a day so reruns reuse the
+# same strings; welcome_copy is cached by Home.py itself.
 
 def welcome_copy() -> str:
     return (
@@ -75,24 +117,28 @@ def welcome_copy() -> str:
         "It's not a diagnosis, but it can guide you towards healthier choices."
     )
 
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
 def low_risk_copy() -> str:
     return (
         "You have a low risk of developing type 2 diabetes in the next 10 years. "
         "Continue to maintain a healthy lifestyle."
     )
 
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
 def medium_risk_copy() -> str:
     return (
         "Your assessment indicates a medium risk of developing type 2 diabetes. "
         "You have some risk factors; take this seriously and consider lifestyle changes to reduce your risk."
     )
 
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
 def high_risk_copy() -> str:
     return (
         "Your risk of developing type 2 diabetes is high. "
         "Please consult a healthcare professional for further evaluation and personalised advice."
     )
 
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
 def lifestyle_recommendations() -> str:
     return (
         "- **Regular Physical Activity**: Aim for at least 150 minutes of moderate-intensity exercise per week.\n"
@@ -100,6 +146,7 @@ def lifestyle_recommendations() -> str:
         "- **Stress Management**: Consider meditation, yoga, or spending time in nature."
     )
 
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
 def dietary_recommendations() -> str:
     return (
         "- **Whole Grains**: Choose brown rice, quinoa, whole wheat bread over refined grains.\n"
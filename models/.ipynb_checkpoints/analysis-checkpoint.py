@@ -1,56 +1,48 @@
+import sys
+
 import pandas as pd
 import numpy as np
 
-# Reproducibility
-np.random.seed(42)
+# Reproducibility (one Generator for every draw)
+rng = np.random.default_rng(42)
 
 # Samples
 n_samples = 500
 
-# Generate features
-age = np.random.normal(43, 12, n_samples).astype(int)
-age = np.clip(age, 18, 80)
-
-sex = np.random.choice(["Male", "Female"], size=n_samples, p=[0.45, 0.55])
-
-bmi = np.random.normal(27.5, 5, n_samples)
-bmi = np.clip(bmi, 15, 45)
-
-waist = np.random.normal(90, 12, n_samples)
-waist = np.clip(waist, 60, 130)
-
-family_history = np.random.choice(["Yes", "No"], size=n_samples, p=[0.3, 0.7])
-
-fbs = np.random.normal(110, 25, n_samples)
-fbs = np.clip(fbs, 70, 200)
-
-hypertension = np.random.choice(["Yes", "No"], size=n_samples, p=[0.25, 0.75])
-
-activity = np.random.choice(["Low", "Moderate", "High"], size=n_samples, p=[0.5, 0.35, 0.15])
+# Category levels, allocated once
+YES_NO = np.array(["Yes", "No"])
+SEXES = np.array(["Male", "Female"])
+ACTIVITY_LEVELS = np.array(["Low", "Moderate", "High"])
 
-smoker = np.random.choice(["Yes", "No"], size=n_samples, p=[0.1, 0.9])
+# Numeric features in one (n, 4) draw: Age, BMI, Waist, Fasting blood sugar,
+# scaled and clipped in place
+numeric = rng.standard_normal((n_samples, 4))
+numeric *= np.array([12, 5, 12, 25])
+numeric += np.array([43, 27.5, 90, 110])
+np.clip(numeric, [18, 15, 60, 70], [80, 45, 130, 200], out=numeric)
 
-# Target outcome (300 positives, 200 negatives)
-outcome = np.zeros(n_samples)
-outcome[:300] = 1
-np.random.shuffle(outcome)
+# Target outcome (300 positives, 200 negatives), placed by one random permutation
+perm = rng.permutation(n_samples)
+outcome = np.concatenate([np.ones(300, dtype=np.int8), np.zeros(n_samples - 300, dtype=np.int8)])[perm]
 
-# Build DataFrame
+# Build DataFrame from one dict of columns
 df = pd.DataFrame({
-    "Age": age,
-    "Sex": sex,
-    "BMI": bmi.round(1),
-    "Waist_Circumference_cm": waist.round(1),
-    "Family_History": family_history,
-    "Fasting_Blood_Sugar_mg_dL": fbs.round(1),
-    "Hypertension": hypertension,
-    "Physical_Activity": activity,
-    "Smoker": smoker,
-    "Outcome": outcome.astype(int)
+    "Age": numeric[:, 0].astype(int),
+    "Sex": rng.choice(SEXES, n_samples, p=[0.45, 0.55]),
+    "BMI": numeric[:, 1].round(1),
+    "Waist_Circumference_cm": numeric[:, 2].round(1),
+    "Family_History": rng.choice(YES_NO, n_samples, p=[0.3, 0.7]),
+    "Fasting_Blood_Sugar_mg_dL": numeric[:, 3].round(1),
+    "Hypertension": rng.choice(YES_NO, n_samples, p=[0.25, 0.75]),
+    "Physical_Activity": rng.choice(ACTIVITY_LEVELS, n_samples, p=[0.5, 0.35, 0.15]),
+    "Smoker": rng.choice(YES_NO, n_samples, p=[0.1, 0.9]),
+    "Outcome": outcome
 })
 
-# Save as CSV in Colab
-df.to_csv("diabetes_nigeria.csv", index=False)
+# Save as Parquet (columnar, fast low-level zstd); pass --csv for the CSV copy
+df.to_parquet("diabetes_nigeria.parquet", index=False, compression="zstd", compression_level=1)
+if "--csv" in sys.argv:
+    df.to_csv("diabetes_nigeria.csv", index=False)
 
 # Preview
 print(df['Outcome'].value_counts())